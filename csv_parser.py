@@ -7,77 +7,234 @@ and prepares them for markdown formatting.
 """
 
 import csv
+import functools
 import sys
-import re
-from typing import List, Dict, Any, Optional
+from collections import defaultdict
+from typing import List, Dict, Any, Iterable, Iterator, Tuple
+
+# Columns actually consumed by the filtering/extraction pipeline
+_USED_COLUMNS = ('Card ID', 'Card Name', 'Card Description', 'Card URL',
+                 'Labels', 'Due Date', 'List Name', 'Board Name', 'Archived')
+
+# Spellings of a truthy Archived cell; membership beats lowercasing
+# every row, since the column only ever holds a few known strings
+_ARCHIVED_TRUE = frozenset(('true', 'True', 'TRUE'))
+
+
+def _confirm_label_match(records: List[Dict[str, Any]],
+                         label_filter: str) -> List[Dict[str, Any]]:
+    """
+    Keep only records whose split Labels list contains label_filter exactly
+
+    The columnar backends pre-filter with a vectorized substring match,
+    which can pass partial-name hits (e.g. "Not Reportable (black_dark)");
+    this confirms the exact-match contract of the stdlib path on the
+    (small) surviving set.
+
+    Args:
+        records: Card dictionaries keyed by CSV column name
+        label_filter: Label to filter by
+
+    Returns:
+        Records whose Labels cell contains label_filter as a whole label
+    """
+    return [record for record in records
+            if label_filter in [label.strip()
+                                for label in record['Labels'].split(',')]]
+
+
+def _record_to_card_info(record: Dict[str, Any],
+                         reportable_label: str) -> Dict[str, Any]:
+    """
+    Convert a CSV-column-keyed record to the extracted card-info shape
+
+    Gives the columnar backends the same output schema as iter_card_info
+    (id/name/team/...), so their batches can feed the markdown stage.
+
+    Args:
+        record: Card dictionary keyed by CSV column name
+        reportable_label: The reportable label to exclude when finding team labels
+
+    Returns:
+        Dictionary with extracted card information
+    """
+    labels = [label.strip() for label in record['Labels'].split(',')
+              if label.strip()]
+    return {
+        'id': record['Card ID'],
+        'name': record['Card Name'],
+        'description': record['Card Description'],
+        'url': record['Card URL'],
+        'labels': labels,
+        'team': _get_team_label(tuple(labels), reportable_label),
+        'due_date': record['Due Date'],
+        'list_name': record['List Name'],
+        'board_name': record['Board Name']
+    }
+
+
+def _code_mask_kernel(list_codes, label_codes, archived_codes,
+                      list_target, label_ok, archived_truthy, out):
+    """
+    Combine factorized column codes into a boolean row mask
+
+    Operates purely on integer codes and per-unique-value lookup tables,
+    so it is compatible with Numba's nopython mode; all string work is
+    hoisted to the (few) unique column values before this runs.
+    """
+    for i in range(out.shape[0]):
+        out[i] = (list_codes[i] == list_target
+                  and label_ok[label_codes[i]]
+                  and not archived_truthy[archived_codes[i]])
+
+
+@functools.lru_cache(maxsize=512)
+def _extract_team_name(label: str) -> str:
+    """
+    Extract team name from a label by removing the color in parentheses
+
+    The same handful of team labels repeat across an export, so results
+    are memoized and repeated labels cost only a cache lookup.
+
+    Args:
+        label: Label string potentially containing color in parentheses
+
+    Returns:
+        Team name without color information
+    """
+    # Remove the trailing color annotation, e.g. "TMM (green)" -> "TMM".
+    # The suffix is simple enough that rfind/slice beats a regex here.
+    name = label.strip()
+    if name.endswith(')'):
+        open_paren = name.rfind('(')
+        if open_paren > 0:
+            name = name[:open_paren].rstrip()
+    return name
+
+
+@functools.lru_cache(maxsize=512)
+def _get_team_label(labels: Tuple[str, ...], reportable_label: str) -> str:
+    """
+    Find the team name from a tuple of labels, excluding the reportable label
+
+    Memoized on the full label tuple since the same label combinations
+    recur on many cards within one export. Labels are expected to be
+    already stripped and non-empty, as produced by the extraction pipeline.
+
+    Args:
+        labels: Tuple of label strings
+        reportable_label: The reportable label to exclude
+
+    Returns:
+        Team name without color information, or "Uncategorized" if no team label found
+    """
+    return next((_extract_team_name(label) for label in labels
+                 if label and label != reportable_label), "Uncategorized")
 
 
 class TrelloCSVParser:
-    """Class to handle parsing and filtering of Trello CSV exports"""
-    
+    """
+    Class to handle parsing and filtering of Trello CSV exports
+
+    No rows are ever retained on the instance: each call to one of the
+    streaming methods opens the file once, makes a single pass, and
+    releases every row that does not survive the filter, so memory is
+    bounded by the matching set rather than the file size.
+    """
+
     def __init__(self, csv_file_path: str):
         """
         Initialize with path to CSV file
-        
+
         Args:
             csv_file_path: Path to the Trello CSV export file
         """
         self.csv_file_path = csv_file_path
-        self.cards = []
-    
-    def parse_csv(self) -> List[Dict[str, Any]]:
+        self._idx = None
+
+    def _iter_rows(self) -> Iterator[List[str]]:
         """
-        Parse the CSV file into a list of dictionaries
-        
-        Returns:
-            List of dictionaries, each representing a card
+        Stream raw rows from the CSV file one at a time
+
+        Uses csv.reader rather than csv.DictReader so no per-row dict is
+        built; the header is read once and self._idx maps the column names
+        in _USED_COLUMNS to their integer positions for indexed access.
+        Blank rows are skipped and short rows are padded to header width,
+        mirroring what DictReader did, so indexed access never raises.
+        The file stays open only while the generator is being consumed,
+        so rows are never all held in memory at once.
+
+        Yields:
+            Lists of column values, each representing a card
         """
         try:
-            with open(self.csv_file_path, 'r', encoding='utf-8') as csv_file:
-                csv_reader = csv.DictReader(csv_file)
-                self.cards = list(csv_reader)
-            return self.cards
+            # newline='' lets the csv module handle line endings itself
+            # (as its docs require), and the 1 MiB buffer cuts syscalls
+            # on large exports
+            with open(self.csv_file_path, 'r', encoding='utf-8',
+                      newline='', buffering=1 << 20) as csv_file:
+                csv_reader = csv.reader(csv_file)
+                header = next(csv_reader, None)
+                if header is None:
+                    return
+                self._idx = {name: header.index(name) for name in _USED_COLUMNS}
+                width = len(header)
+                for row in csv_reader:
+                    # DictReader skipped blank lines and padded short rows
+                    # (restval); preserve that so indexed access is safe
+                    if not row:
+                        continue
+                    if len(row) < width:
+                        row.extend([''] * (width - len(row)))
+                    yield row
         except Exception as e:
             print(f"Error parsing CSV file: {e}")
-            return []
-    
-    def filter_cards(self, list_name: str = "Project List", 
+
+    def parse_csv(self) -> Iterator[List[str]]:
+        """
+        Parse the CSV file into a stream of rows
+
+        Returns:
+            Iterator of lists of column values, each representing a card
+        """
+        return self._iter_rows()
+
+    def filter_cards(self, list_name: str = "Project List",
                     label_filter: str = "Reportable (black_dark)",
-                    include_archived: bool = False) -> List[Dict[str, Any]]:
+                    include_archived: bool = False) -> Iterator[List[str]]:
         """
         Filter cards based on list name, label, and archived status
-        
+
         Args:
             list_name: Name of the list to filter by
             label_filter: Label to filter by
             include_archived: Whether to include archived cards
-            
-        Returns:
-            Filtered list of card dictionaries
+
+        Yields:
+            Card rows matching the criteria
         """
-        if not self.cards:
-            self.parse_csv()
-        
-        filtered_cards = []
-        
-        for card in self.cards:
+        for row in self._iter_rows():
+            idx = self._idx
+
             # Check if card is in the specified list
-            if card.get('List Name') != list_name:
+            if row[idx['List Name']] != list_name:
                 continue
-            
+
             # Check if card is archived (if we don't want archived cards)
-            if not include_archived and card.get('Archived', '').lower() == 'true':
+            if not include_archived and row[idx['Archived']] in _ARCHIVED_TRUE:
                 continue
-            
+
             # Check if card has the specified label
-            # The Labels column contains comma-separated values
-            labels = card.get('Labels', '').split(',')
-            labels = [label.strip() for label in labels]
-            
+            # The Labels column contains comma-separated values; a cheap
+            # substring test drops most rows before any split/strip work
+            raw_labels = row[idx['Labels']]
+            if label_filter not in raw_labels:
+                continue
+
+            labels = [label.strip() for label in raw_labels.split(',')]
+
             if label_filter in labels:
-                filtered_cards.append(card)
-        
-        return filtered_cards
+                yield row
     
     def extract_team_name(self, label: str) -> str:
         """
@@ -89,8 +246,7 @@ class TrelloCSVParser:
         Returns:
             Team name without color information
         """
-        # Remove color information in parentheses
-        return re.sub(r'\s*\([^)]*\)\s*$', '', label).strip()
+        return _extract_team_name(label)
     
     def get_team_label(self, labels: List[str], reportable_label: str = "Reportable (black_dark)") -> str:
         """
@@ -103,49 +259,340 @@ class TrelloCSVParser:
         Returns:
             Team name without color information, or "Uncategorized" if no team label found
         """
-        for label in labels:
-            if label != reportable_label and label.strip():
-                return self.extract_team_name(label)
-        
-        return "Uncategorized"
+        return _get_team_label(tuple(labels), reportable_label)
     
-    def extract_card_info(self, cards: List[Dict[str, Any]], 
+    def extract_card_info(self, cards: Iterable[List[str]],
                          reportable_label: str = "Reportable (black_dark)") -> List[Dict[str, str]]:
         """
         Extract relevant information from cards
-        
+
         Args:
-            cards: List of card dictionaries from CSV
+            cards: Iterable of card rows from the CSV
             reportable_label: The reportable label to exclude when finding team labels
-            
+
         Returns:
             List of dictionaries with extracted card information
         """
         extracted_info = []
-        
-        for card in cards:
+
+        for row in cards:
+            idx = self._idx
+
             # Get all labels
-            labels = card.get('Labels', '').split(',')
+            labels = row[idx['Labels']].split(',')
             labels = [label.strip() for label in labels if label.strip()]
-            
+
             # Get team label
             team = self.get_team_label(labels, reportable_label)
-            
+
             card_info = {
-                'id': card.get('Card ID', ''),
-                'name': card.get('Card Name', ''),
-                'description': card.get('Card Description', ''),
-                'url': card.get('Card URL', ''),
+                'id': row[idx['Card ID']],
+                'name': row[idx['Card Name']],
+                'description': row[idx['Card Description']],
+                'url': row[idx['Card URL']],
                 'labels': labels,
                 'team': team,
-                'due_date': card.get('Due Date', None),
-                'list_name': card.get('List Name', ''),
-                'board_name': card.get('Board Name', '')
+                'due_date': row[idx['Due Date']],
+                'list_name': row[idx['List Name']],
+                'board_name': row[idx['Board Name']]
             }
             extracted_info.append(card_info)
-            
+
         return extracted_info
 
+    def iter_card_info(self, list_name: str = "Project List",
+                      label_filter: str = "Reportable (black_dark)",
+                      include_archived: bool = False,
+                      reportable_label: str = "Reportable (black_dark)") -> Iterator[Dict[str, Any]]:
+        """
+        Stream extracted info for cards matching the filter criteria
+
+        Fuses filter_cards and extract_card_info into a single pass over
+        the CSV, so each row is read, filtered, and extracted at most once
+        and the Labels column is split only once per surviving card.
+
+        Args:
+            list_name: Name of the list to filter by
+            label_filter: Label to filter by
+            include_archived: Whether to include archived cards
+            reportable_label: The reportable label to exclude when finding team labels
+
+        Yields:
+            Dictionaries with extracted card information
+        """
+        # Many cards share an identical raw Labels value, so the parsed
+        # labels, the exact-match verdict, and the team are cached per
+        # raw string and duplicates cost a single dict probe
+        label_cache = {}
+
+        for row in self._iter_rows():
+            idx = self._idx
+
+            # Check if card is in the specified list
+            if row[idx['List Name']] != list_name:
+                continue
+
+            # Check if card is archived (if we don't want archived cards)
+            if not include_archived and row[idx['Archived']] in _ARCHIVED_TRUE:
+                continue
+
+            # Check if card has the specified label
+            # The Labels column contains comma-separated values; a cheap
+            # substring test drops most rows before any split/strip work
+            raw_labels = row[idx['Labels']]
+            if label_filter not in raw_labels:
+                continue
+
+            entry = label_cache.get(raw_labels)
+            if entry is None:
+                # Cache a tuple so yielded cards can't alias each other
+                labels = tuple(label.strip() for label in raw_labels.split(',')
+                               if label.strip())
+                entry = (labels, label_filter in labels,
+                         self.get_team_label(labels, reportable_label))
+                label_cache[raw_labels] = entry
+
+            labels, has_filter_label, team = entry
+            if not has_filter_label:
+                continue
+
+            yield {
+                'id': row[idx['Card ID']],
+                'name': row[idx['Card Name']],
+                'description': row[idx['Card Description']],
+                'url': row[idx['Card URL']],
+                'labels': list(labels),
+                'team': team,
+                'due_date': row[idx['Due Date']],
+                'list_name': row[idx['List Name']],
+                'board_name': row[idx['Board Name']]
+            }
+
+    def card_info_by_team(self, list_name: str = "Project List",
+                         label_filter: str = "Reportable (black_dark)",
+                         include_archived: bool = False,
+                         reportable_label: str = "Reportable (black_dark)") -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Extract matching cards grouped by team in a single pass
+
+        The team is already computed while extracting each card, so the
+        grouping is built here directly instead of re-iterating the
+        extracted cards afterwards.
+
+        Args:
+            list_name: Name of the list to filter by
+            label_filter: Label to filter by
+            include_archived: Whether to include archived cards
+            reportable_label: The reportable label to exclude when finding team labels
+
+        Returns:
+            Dictionary with team names as keys and lists of cards as values
+        """
+        teams = defaultdict(list)
+
+        for card_info in self.iter_card_info(list_name, label_filter,
+                                             include_archived, reportable_label):
+            teams[card_info['team']].append(card_info)
+
+        # Convert to regular dict
+        return dict(teams)
+
+    def parse_and_filter_pandas(self, list_name: str = "Project List",
+                               label_filter: str = "Reportable (black_dark)",
+                               include_archived: bool = False) -> List[Dict[str, Any]]:
+        """
+        Parse and filter the CSV using pandas (optional fast path)
+
+        For exports with tens of thousands of rows, pandas' C parser and
+        vectorized column masks are much faster than the per-row Python
+        loop. Requires pandas to be installed; the stdlib pipeline above
+        remains the default.
+
+        Args:
+            list_name: Name of the list to filter by
+            label_filter: Label to filter by
+            include_archived: Whether to include archived cards
+
+        Returns:
+            Filtered list of card dictionaries keyed by CSV column name
+        """
+        import re
+        import pandas as pd
+
+        df = pd.read_csv(self.csv_file_path, usecols=list(_USED_COLUMNS),
+                         dtype=str).fillna('')
+
+        mask = (df['List Name'] == list_name) \
+            & df['Labels'].str.contains(re.escape(label_filter), na=False)
+        if not include_archived:
+            mask &= df['Archived'].str.lower() != 'true'
+
+        # Records keep the CSV column names for downstream compatibility;
+        # the substring mask needs the exact-match confirmation on top
+        return _confirm_label_match(df[mask].to_dict('records'), label_filter)
+
+    def parse_and_filter_arrow(self, list_name: str = "Project List",
+                              label_filter: str = "Reportable (black_dark)",
+                              include_archived: bool = False) -> List[Dict[str, Any]]:
+        """
+        Parse and filter the CSV using pyarrow (optional fast path)
+
+        pyarrow's multithreaded C++ CSV reader is typically several times
+        faster than the stdlib csv module, and the filter runs as Arrow
+        compute kernels over columnar data. Requires pyarrow.
+
+        Args:
+            list_name: Name of the list to filter by
+            label_filter: Label to filter by
+            include_archived: Whether to include archived cards
+
+        Returns:
+            Filtered list of card dictionaries keyed by CSV column name
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.csv as pac
+
+        table = pac.read_csv(
+            self.csv_file_path,
+            # Skip malformed rows instead of raising, like the stdlib
+            # path's blank/short row handling
+            parse_options=pac.ParseOptions(
+                invalid_row_handler=lambda row: 'skip'),
+            convert_options=pac.ConvertOptions(
+                include_columns=list(_USED_COLUMNS),
+                column_types={name: 'string' for name in _USED_COLUMNS},
+                strings_can_be_null=False))
+
+        # Substring match as the vectorized pre-filter, like the stdlib path
+        mask = pc.and_(pc.equal(table['List Name'], list_name),
+                       pc.match_substring(table['Labels'], label_filter))
+        if not include_archived:
+            mask = pc.and_(mask, pc.invert(
+                pc.is_in(table['Archived'],
+                         value_set=pa.array(sorted(_ARCHIVED_TRUE)))))
+
+        # Exact-match confirmation on the (small) surviving set
+        return _confirm_label_match(table.filter(mask).to_pylist(), label_filter)
+
+    def parse_and_filter_numba(self, list_name: str = "Project List",
+                              label_filter: str = "Reportable (black_dark)",
+                              include_archived: bool = False) -> List[Dict[str, Any]]:
+        """
+        Parse and filter using a JIT-compiled integer-code kernel
+
+        Intended for exports in the millions of rows, where even the
+        vectorized pandas masks spend most of their time in string
+        comparisons. The filter columns are factorized to integer codes,
+        the list/label/archived tests are evaluated once per unique value
+        (there are only a handful), and the per-row loop just combines
+        codes -- which Numba compiles to machine code when installed.
+        Falls back to the same loop in pure Python/numpy otherwise.
+        Requires pandas (and optionally numba).
+
+        Args:
+            list_name: Name of the list to filter by
+            label_filter: Label to filter by
+            include_archived: Whether to include archived cards
+
+        Returns:
+            Filtered list of card dictionaries keyed by CSV column name
+        """
+        import numpy as np
+        import pandas as pd
+
+        df = pd.read_csv(self.csv_file_path, usecols=list(_USED_COLUMNS),
+                         dtype=str).fillna('')
+
+        list_codes, list_uniques = pd.factorize(df['List Name'])
+        label_codes, label_uniques = pd.factorize(df['Labels'])
+        archived_codes, archived_uniques = pd.factorize(df['Archived'])
+
+        # Resolve each test once per unique column value
+        list_target = -1
+        for code, value in enumerate(list_uniques):
+            if value == list_name:
+                list_target = code
+                break
+        label_ok = np.array(
+            [label_filter in raw
+             and label_filter in [label.strip() for label in raw.split(',')]
+             for raw in label_uniques], dtype=np.bool_)
+        if include_archived:
+            archived_truthy = np.zeros(len(archived_uniques), dtype=np.bool_)
+        else:
+            archived_truthy = np.array([value in _ARCHIVED_TRUE
+                                        for value in archived_uniques], dtype=np.bool_)
+
+        kernel = _code_mask_kernel
+        try:
+            import numba
+            kernel = numba.njit(cache=True)(_code_mask_kernel)
+        except ImportError:
+            pass
+
+        mask = np.empty(len(df), dtype=np.bool_)
+        kernel(list_codes, label_codes, archived_codes,
+               list_target, label_ok, archived_truthy, mask)
+
+        return df[mask].to_dict('records')
+
+    def iter_filtered(self, chunksize: int = 10000, engine: str = 'csv',
+                     list_name: str = "Project List",
+                     label_filter: str = "Reportable (black_dark)",
+                     include_archived: bool = False,
+                     reportable_label: str = "Reportable (black_dark)") -> Iterator[List[Dict[str, Any]]]:
+        """
+        Stream matching cards in fixed-size batches
+
+        Keeps peak memory flat regardless of CSV size: only one batch of
+        matching cards (plus, for pandas, one raw chunk) is held at a
+        time, so even exports larger than RAM stream through.
+
+        Args:
+            chunksize: Maximum number of cards per yielded batch
+            engine: 'csv' for the stdlib pipeline, 'pandas' for the pandas backend
+            list_name: Name of the list to filter by
+            label_filter: Label to filter by
+            include_archived: Whether to include archived cards
+            reportable_label: The reportable label to exclude when finding team labels
+
+        Yields:
+            Lists of extracted card dictionaries, in the same shape as
+            iter_card_info regardless of engine
+        """
+        if engine == 'pandas':
+            import re
+            import pandas as pd
+
+            for df in pd.read_csv(self.csv_file_path, usecols=list(_USED_COLUMNS),
+                                  dtype=str, chunksize=chunksize):
+                df = df.fillna('')
+                mask = (df['List Name'] == list_name) \
+                    & df['Labels'].str.contains(re.escape(label_filter), na=False)
+                if not include_archived:
+                    mask &= df['Archived'].str.lower() != 'true'
+
+                # Same exact-match confirmation as parse_and_filter_pandas,
+                # then extraction into the common card-info shape
+                batch = [_record_to_card_info(record, reportable_label)
+                         for record in _confirm_label_match(
+                             df[mask].to_dict('records'), label_filter)]
+                if batch:
+                    yield batch
+            return
+
+        batch = []
+        for card_info in self.iter_card_info(list_name, label_filter,
+                                             include_archived, reportable_label):
+            batch.append(card_info)
+            if len(batch) >= chunksize:
+                yield batch
+                batch = []
+
+        if batch:
+            yield batch
+
 
 def main():
     """Main function to demonstrate the usage of TrelloCSVParser"""
@@ -157,23 +604,22 @@ def main():
     
     try:
         parser = TrelloCSVParser(csv_file_path)
-        
+
         # Filter cards from "Project List" with label "Reportable (black_dark)"
-        filtered_cards = parser.filter_cards(
+        # and extract their info in a single pass
+        card_info = list(parser.iter_card_info(
             list_name="Project List",
             label_filter="Reportable (black_dark)",
             include_archived=False
-        )
-        
-        # Extract relevant information
-        card_info = parser.extract_card_info(filtered_cards)
+        ))
         
         print(f"Found {len(card_info)} cards matching the criteria:")
         for card in card_info:
             print(f"\nTeam: {card['team']}")
             print(f"Name: {card['name']}")
-            print(f"Description: {card['description'][:100]}..." if len(card['description']) > 100 
-                  else f"Description: {card['description']}")
+            description = card['description']
+            print(f"Description: {description[:100]}..." if len(description) > 100
+                  else f"Description: {description}")
         
         # Here we would format to markdown, but we'll implement that later
         print("\nReady to format these cards to markdown.")
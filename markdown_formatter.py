@@ -5,60 +5,76 @@ Markdown Formatter for Trello Cards
 This script takes filtered Trello card data and formats it into a markdown document.
 """
 
-import os
-import sys
 import re
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable
 from collections import defaultdict
 
 
+# Emoji strings and their text equivalents, collapsed into one pattern
+# so the text is scanned once regardless of how many emojis are mapped
+_EMOJI_REPLACEMENTS = {
+    ":question:": "(needs clarification)",
+    ":warning:": "(important note)"
+}
+_EMOJI_RE = re.compile('|'.join(re.escape(emoji) for emoji in _EMOJI_REPLACEMENTS))
+
+
 def replace_emoji_strings(text: str) -> str:
     """
     Replace specific emoji strings with their text equivalents
-    
+
     Args:
         text: The text to process
-        
+
     Returns:
         Text with emoji strings replaced
     """
-    replacements = {
-        ":question:": "(needs clarification)",
-        ":warning:": "(important note)"
-    }
-    
-    for emoji, replacement in replacements.items():
-        text = text.replace(emoji, replacement)
-    
-    return text
+    # All mapped emojis contain ':', so most texts can skip the regex pass
+    if ':' not in text:
+        return text
 
+    return _EMOJI_RE.sub(lambda match: _EMOJI_REPLACEMENTS[match.group(0)], text)
 
-def format_card_as_markdown(card: Dict[str, Any]) -> str:
+
+def _card_fragments(card: Dict[str, Any]) -> List[str]:
     """
-    Format a single card as markdown
-    
+    Build the markdown fragments for a single card
+
     Args:
         card: Dictionary containing card information
-        
+
     Returns:
-        String with markdown formatted card
+        List of markdown string fragments for the card
     """
     # Start with the card name as a header (now 3rd level since team is 2nd level)
     card_name = replace_emoji_strings(card['name'])
-    markdown = f"### {card_name}\n\n"
-    
+    fragments = [f"### {card_name}\n\n"]
+
     # Add the card description with emoji strings replaced
     if card['description']:
         description = replace_emoji_strings(card['description'])
-        markdown += f"{description}\n\n"
+        fragments.append(f"{description}\n\n")
     else:
-        markdown += "*No description provided*\n\n"
-    
+        fragments.append("*No description provided*\n\n")
+
     # Add an empty line instead of horizontal rule
-    markdown += "\n"
-    
-    return markdown
+    fragments.append("\n")
+
+    return fragments
+
+
+def format_card_as_markdown(card: Dict[str, Any]) -> str:
+    """
+    Format a single card as markdown
+
+    Args:
+        card: Dictionary containing card information
+
+    Returns:
+        String with markdown formatted card
+    """
+    return "".join(_card_fragments(card))
 
 
 def group_cards_by_team(cards: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
@@ -91,21 +107,9 @@ def get_ordered_teams(teams: Dict[str, List[Dict[str, Any]]]) -> List[str]:
     Returns:
         List of team names in the desired order
     """
-    ordered_teams = []
-    
-    # Add Group-wide first if it exists
-    if "Group-wide" in teams:
-        ordered_teams.append("Group-wide")
-    
-    # Add SRE second if it exists
-    if "SRE" in teams:
-        ordered_teams.append("SRE")
-    
-    # Add the rest of the teams alphabetically
-    remaining_teams = sorted([team for team in teams.keys() if team not in ["Group-wide", "SRE"]])
-    ordered_teams.extend(remaining_teams)
-    
-    return ordered_teams
+    # Single sort: priority teams first, everything else alphabetically
+    priority = {"Group-wide": 0, "SRE": 1}
+    return sorted(teams, key=lambda team: (priority.get(team, 2), team))
 
 
 def format_cards_to_markdown(cards: List[Dict[str, Any]], 
@@ -122,37 +126,112 @@ def format_cards_to_markdown(cards: List[Dict[str, Any]],
     Returns:
         Complete markdown document as a string
     """
-    if not cards:
+    # Group cards by team, then delegate to the grouped formatter
+    return format_teams_to_markdown(group_cards_by_team(cards),
+                                    title=title,
+                                    include_metadata=include_metadata)
+
+
+def format_teams_to_markdown(teams: Dict[str, List[Dict[str, Any]]],
+                           title: str = "Transaction Management and Middleware",
+                           include_metadata: bool = True) -> str:
+    """
+    Format cards already grouped by team into a complete markdown document
+
+    Preferred over format_cards_to_markdown when the pipeline grouped the
+    cards during extraction, since it avoids re-iterating every card just
+    to rebuild the same grouping.
+
+    Args:
+        teams: Dictionary with team names as keys and lists of cards as values
+        title: Title for the markdown document (default now set to "Transaction Management and Middleware")
+        include_metadata: Whether to include metadata about the export
+
+    Returns:
+        Complete markdown document as a string
+    """
+    if not teams:
         return "# Transaction Management and Middleware\n\n*No cards found matching the criteria.*"
-    
-    # Start with the fixed title
-    markdown = "# Transaction Management and Middleware\n\n"
-    
+
+    # Accumulate fragments and join once at the end; repeated += on a
+    # string reallocates the whole document for every appended piece
+    parts = ["# Transaction Management and Middleware\n\n"]
+
     # Add metadata if requested
     if include_metadata:
         current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        markdown += f"*As of: {current_time}*\n\n"
+        parts.append(f"*As of: {current_time}*\n\n")
         # Add empty line instead of horizontal rule
-        markdown += "\n"
-    
-    # Group cards by team
-    teams = group_cards_by_team(cards)
-    
+        parts.append("\n")
+
     # Get teams in the desired order
     ordered_team_names = get_ordered_teams(teams)
-    
+
     # Add each team section in the specified order
     for team in ordered_team_names:
         team_cards = teams[team]
-        
+
         # Add team name as second-level heading
-        markdown += f"## {team}\n\n"
-        
+        parts.append(f"## {team}\n\n")
+
         # Add each card in this team
         for card in team_cards:
-            markdown += format_card_as_markdown(card)
-    
-    return markdown
+            parts.extend(_card_fragments(card))
+
+    return "".join(parts)
+
+
+def write_markdown(cards: Iterable[Dict[str, Any]], output_file: str,
+                   title: str = "Transaction Management and Middleware",
+                   include_metadata: bool = True) -> int:
+    """
+    Write cards to a markdown file, streaming fragments as they are built
+
+    Unlike format_cards_to_markdown + save_markdown_to_file, this never
+    materializes the whole document as one string: each fragment is
+    written to the open file handle as it is produced, so peak memory
+    does not grow with the size of the output.
+
+    Args:
+        cards: Iterable of card dictionaries (e.g. from iter_card_info)
+        output_file: Path to the output file
+        title: Title for the markdown document (default now set to "Transaction Management and Middleware")
+        include_metadata: Whether to include metadata about the export
+
+    Returns:
+        Number of cards written; no file is created when there are no cards
+    """
+    # Grouping by team (and ordering teams) requires seeing every card,
+    # so the matching set is still buffered -- only the output string is not
+    teams = group_cards_by_team(cards)
+    card_count = sum(len(team_cards) for team_cards in teams.values())
+
+    # Nothing matched: leave no file behind
+    if not teams:
+        return 0
+
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write("# Transaction Management and Middleware\n\n")
+
+        # Add metadata if requested
+        if include_metadata:
+            current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            f.write(f"*As of: {current_time}*\n\n")
+            # Add empty line instead of horizontal rule
+            f.write("\n")
+
+        # Add each team section in the specified order
+        for team in get_ordered_teams(teams):
+            # Add team name as second-level heading
+            f.write(f"## {team}\n\n")
+
+            # Add each card in this team
+            for card in teams[team]:
+                for fragment in _card_fragments(card):
+                    f.write(fragment)
+
+    print(f"Markdown saved to: {output_file}")
+    return card_count
 
 
 def save_markdown_to_file(markdown: str, output_file: str) -> None:
@@ -175,13 +254,10 @@ def main():
     print("This module is typically imported, not run directly.")
     print("Example usage:")
     print("  from csv_parser import TrelloCSVParser")
-    print("  from markdown_formatter import format_cards_to_markdown, save_markdown_to_file")
+    print("  from markdown_formatter import write_markdown")
     print("")
     print("  parser = TrelloCSVParser('trello_export.csv')")
-    print("  filtered_cards = parser.filter_cards()")
-    print("  card_info = parser.extract_card_info(filtered_cards)")
-    print("  markdown = format_cards_to_markdown(card_info)")
-    print("  save_markdown_to_file(markdown, 'output.md')")
+    print("  write_markdown(parser.iter_card_info(), 'output.md')")
 
 
 if __name__ == "__main__":
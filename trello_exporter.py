@@ -11,7 +11,7 @@ import sys
 import argparse
 from datetime import datetime
 from csv_parser import TrelloCSVParser
-from markdown_formatter import format_cards_to_markdown, save_markdown_to_file
+from markdown_formatter import write_markdown
 
 
 def parse_arguments():
@@ -73,30 +73,23 @@ def main():
         args.output = f"trello_export_{timestamp}.md"
     
     try:
-        # Parse and filter the CSV
+        # Parse, filter, and extract in a single pass, streaming the
+        # markdown straight to the output file
         parser = TrelloCSVParser(args.csv_file)
-        filtered_cards = parser.filter_cards(
-            list_name=args.list_name,
-            label_filter=args.label,
-            include_archived=args.include_archived
+        card_count = write_markdown(
+            parser.iter_card_info(
+                list_name=args.list_name,
+                label_filter=args.label,
+                include_archived=args.include_archived
+            ),
+            args.output
         )
-        
-        # Extract relevant information
-        card_info = parser.extract_card_info(filtered_cards)
-        
-        if not card_info:
+
+        if not card_count:
             print("No cards found matching the criteria.")
             return 1
-        
-        print(f"Found {len(card_info)} cards matching the criteria.")
-        
-        # Format to markdown
-        markdown = format_cards_to_markdown(card_info)
-        
-        # Save to file
-        save_markdown_to_file(markdown, args.output)
-        
-        print(f"Successfully exported {len(card_info)} cards to {args.output}")
+
+        print(f"Successfully exported {card_count} cards to {args.output}")
         
         # Delete the input CSV file if --keep-csv is not specified
         if not args.keep_csv: